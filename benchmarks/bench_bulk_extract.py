@@ -0,0 +1,49 @@
+"""
+Measure bulk_extract throughput with 1 to N worker processes.
+
+Run from the repository root with: python -m benchmarks.bench_bulk_extract [max_workers]
+"""
+import os
+import sys
+import time
+
+from cd_parser.bulk import bulk_extract
+from cd_parser.schema import Field, Schema
+
+
+SCHEMA = Schema({
+    'title': '//title',
+    'price': Field('//span[@class="price"]', regex=r'([\d.]+)', post=float),
+    'links': Field('//a', kind='attr', attr='href', many=True),
+})
+
+
+def make_documents(count=2000, rows=200):
+    documents = []
+    for i in range(count):
+        body = ''.join(f'<tr><td><a href="/item/{i}/{row}">Item {row}</a></td></tr>' for row in range(rows))
+        page = (f'<html><head><title>Page {i}</title></head><body><span class="price">{i}.99</span>'
+                f'<table>{body}</table></body></html>')
+        documents.append(page.encode())
+    return documents
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    documents = make_documents()
+    size = sum(len(document) for document in documents) / 1e6
+    print(f'{len(documents)} documents, {size:.1f} MB, {os.cpu_count()} CPUs')
+    baseline = None
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        results = bulk_extract(documents, SCHEMA, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert len(results) == len(documents)
+        baseline = baseline or elapsed
+        print(f'workers={workers:<3} {elapsed:7.2f} s  {len(documents) / elapsed:8.0f} docs/s  x{baseline / elapsed:.2f}')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
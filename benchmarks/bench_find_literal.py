@@ -0,0 +1,35 @@
+"""
+Compare the literal and regex paths of find_before/find_after/find_between on a ~1 MB page.
+
+Run from the repository root with: python -m benchmarks.bench_find_literal
+"""
+import timeit
+
+from cd_parser.regex_parser import RegexParser
+
+
+def make_page(size=1 << 20):
+    line = '<tr><td class="name">item</td><td class="price">$12.50</td></tr>'
+    body = ' '.join([line] * (size // (len(line) + 1)))
+    return f'<html><body><table>{body}</table><p>Total: $999</p></body></html>'
+
+
+def main(number=20):
+    page = make_page()
+    cases = [
+        ('find_before', ('</html>', page)),
+        ('find_after', ('Total: ', page)),
+        ('find_between', ('<p>', '</p>', page)),
+    ]
+    print(f'page size: {len(page)} chars, {number} runs each')
+    for name, args in cases:
+        method = getattr(RegexParser, name)
+        assert method(*args) == method(*args, use_regex=True)
+        literal = timeit.timeit(lambda: method(*args), number=number)
+        regex = timeit.timeit(lambda: method(*args, use_regex=True), number=number)
+        print(f'{name:<13} literal {literal / number * 1e3:8.3f} ms   '
+              f'regex {regex / number * 1e3:8.3f} ms   speedup x{regex / literal:.1f}')
+
+
+if __name__ == '__main__':
+    main()
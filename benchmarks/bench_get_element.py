@@ -0,0 +1,30 @@
+"""
+Compare the early-exit get_element with taking the first item of get_elements on selectors
+that match ~50,000 nodes.
+
+Run from the repository root with: python -m benchmarks.bench_get_element
+"""
+import timeit
+
+from cd_parser.xpath_parser import XpathParser
+
+
+def make_page(rows=25000):
+    row = '<tr><td class="name">item</td><td class="price">$12.50</td></tr>'
+    return f'<html><body><table>{row * rows}</table></body></html>'
+
+
+def main(number=20):
+    parser = XpathParser(make_page())
+    selectors = ['//td', '//td[@class="price"]', '//tr/td[2]', '//table//td', '//td/text()']
+    print(f'{len(parser.get_elements("//td"))} <td> nodes, {number} runs each')
+    for x_path in selectors:
+        assert parser.get_element(x_path) == parser.get_elements(x_path)[0]
+        full = timeit.timeit(lambda: parser.get_elements(x_path)[0], number=number)
+        first = timeit.timeit(lambda: parser.get_element(x_path), number=number)
+        print(f'{x_path:<22} get_elements()[0] {full / number * 1e3:8.3f} ms   '
+              f'get_element {first / number * 1e3:8.3f} ms   speedup x{full / first:.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Compare building trees with a fresh default parser per document, the reused default profile
+and the extraction profile on a script-heavy page: parse time, the time of a '//body//text()'
+query on the result, and the size of the resulting tree. Times are the best of five repeats.
+
+Run from the repository root with: python -m benchmarks.bench_parser_profile
+"""
+import timeit
+
+from lxml import html
+
+from cd_parser.profile import DEFAULT_PROFILE, EXTRACTION_PROFILE
+from cd_parser.xpath_parser import XpathParser
+
+
+def make_page(rows=2000):
+    script = '<script>window.data = {"key": "value", "items": [1, 2, 3]};</script>'
+    style = '<style>.price { color: red; } .name { font-weight: bold; }</style>'
+    row = ('\n    <tr>\n      <!-- row -->\n      <td class="name">item</td>\n'
+           '      <td class="price">$12.50</td>\n    </tr>')
+    body = f'{script}{style}<table>{row * rows}</table>'
+    return f'<html><head>{script * 20}{style * 20}</head><body>{body * 5}</body></html>'.encode()
+
+
+def best(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main(number=10):
+    page = make_page()
+    cases = [
+        ('fresh parser', lambda: XpathParser.from_bytes(page, parser=html.HTMLParser())),
+        ('default profile', lambda: XpathParser.from_bytes(page, profile=DEFAULT_PROFILE)),
+        ('extraction profile', lambda: XpathParser.from_bytes(page, profile=EXTRACTION_PROFILE)),
+    ]
+    print(f'page size: {len(page)} bytes, {number} runs per repeat')
+    for name, parse in cases:
+        parser = parse()
+        nodes = len(parser.get_elements('//node()'))
+        parse_time = best(parse, number)
+        query_time = best(lambda: parser.get_elements('//body//text()'), number)
+        print(f'{name:<19} parse {parse_time * 1e3:8.3f} ms   query {query_time * 1e3:8.3f} ms   {nodes} nodes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare one RegexSet scan against sequential RegexParser.find_all calls for 40 patterns.
+
+Two catalogues are timed: patterns starting with distinctive literals, which re can
+locate quickly on its own, and patterns starting with character classes, where every
+sequential pass has to test each position of the page.
+
+Run from the repository root with: python -m benchmarks.bench_regex_set
+"""
+import timeit
+
+from cd_parser.regex_parser import RegexParser
+from cd_parser.regex_set import RegexSet
+
+
+def literal_patterns(count=40):
+    return {f'attr{i}': rf'data-attr{i}="[^"]*"' for i in range(count)}
+
+
+def class_patterns(count=40):
+    shapes = [r'\d{{4}}-\d{{2}}-{0:02d}', r'\w+@example{0}\.com', r'\d+\.\d{{2}} EUR{0}\b', r'[A-Z]{{3}}-{0}1234']
+    return {f'shape{i}': shapes[i % len(shapes)].format(i) for i in range(count)}
+
+
+def make_page(rows=5000):
+    row = ('<tr data-attr{0}="v{0}"><td>2024-01-{0:02d}</td><td>user@example{0}.com</td>'
+           '<td>12.50 EUR{0}</td><td>SKU-{0}1234</td><td>plain text cell</td></tr>')
+    return '<table>' + ''.join(row.format(i % 40) for i in range(rows)) + '</table>'
+
+
+def compare(label, patterns, page, number):
+    regex_set = RegexSet(patterns)
+
+    def sequential():
+        return {name: RegexParser.find_all(pattern, page) for name, pattern in patterns.items()}
+
+    assert regex_set.find_all(page) == sequential()
+    single = timeit.timeit(lambda: regex_set.find_all(page), number=number)
+    many = timeit.timeit(sequential, number=number)
+    print(f'{label:<17} RegexSet {single / number * 1e3:8.2f} ms   '
+          f'find_all x{len(patterns)} {many / number * 1e3:8.2f} ms   speedup x{many / single:.2f}')
+
+
+def main(number=5):
+    page = make_page()
+    print(f'page size: {len(page)} chars, {number} runs each')
+    compare('literal prefixes', literal_patterns(), page, number)
+    compare('class prefixes', class_patterns(), page, number)
+
+
+if __name__ == '__main__':
+    main()
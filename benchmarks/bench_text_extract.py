@@ -0,0 +1,44 @@
+"""
+Compare get_texts/get_attrs with reading .text/.get() from get_elements on ~50,000 nodes,
+measuring time and peak memory allocated by the call.
+
+Run from the repository root with: python -m benchmarks.bench_text_extract
+"""
+import timeit
+import tracemalloc
+
+from cd_parser.xpath_parser import XpathParser
+
+
+def make_page(rows=25000):
+    row = '<tr><td class="name">item</td><td class="price" data-sku="A-1">$12.50</td></tr>'
+    return f'<html><body><table>{row * rows}</table></body></html>'
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(number=10):
+    parser = XpathParser(make_page())
+    cases = [
+        ('texts', lambda: [element.text for element in parser.get_elements('//td')],
+         lambda: parser.get_texts('//td')),
+        ('attrs', lambda: [element.get('data-sku') for element in parser.get_elements('//td[@data-sku]')],
+         lambda: parser.get_attrs('//td', 'data-sku')),
+    ]
+    print(f'{number} runs each')
+    for name, elements, strings in cases:
+        assert elements() == strings()
+        slow = timeit.timeit(elements, number=number) / number
+        fast = timeit.timeit(strings, number=number) / number
+        print(f'{name:<6} elements {slow * 1e3:8.3f} ms {peak_memory(elements) / 1e6:6.2f} MB   '
+              f'strings {fast * 1e3:8.3f} ms {peak_memory(strings) / 1e6:6.2f} MB   speedup x{slow / fast:.1f}')
+
+
+if __name__ == '__main__':
+    main()
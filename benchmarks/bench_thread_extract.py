@@ -0,0 +1,34 @@
+"""
+Compare extract_many (threads) with bulk_extract (processes) on 1, 2, 4 and 8 workers.
+
+Run from the repository root with: python -m benchmarks.bench_thread_extract
+"""
+import os
+import time
+
+from cd_parser.bulk import bulk_extract, extract_many
+
+from .bench_bulk_extract import SCHEMA, make_documents
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(worker_counts=(1, 2, 4, 8)):
+    documents = make_documents()
+    print(f'{len(documents)} documents, {os.cpu_count()} CPUs')
+    thread_base = process_base = None
+    for workers in worker_counts:
+        threads = timed(extract_many, documents, SCHEMA, workers=workers)
+        processes = timed(bulk_extract, documents, SCHEMA, workers=workers)
+        thread_base = thread_base or threads
+        process_base = process_base or processes
+        print(f'workers={workers:<3} threads {len(documents) / threads:7.0f} docs/s (x{thread_base / threads:.2f})   '
+              f'processes {len(documents) / processes:7.0f} docs/s (x{process_base / processes:.2f})')
+
+
+if __name__ == '__main__':
+    main()
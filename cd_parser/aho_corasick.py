@@ -0,0 +1,178 @@
+import heapq
+from array import array
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    An Aho-Corasick automaton for finding many literal keywords in one linear scan.
+
+    Scan time depends on the length of the text and the number of matches, not on the
+    number of keywords, which makes it a better fit than a huge 'foo|bar|baz|...' regex
+    for keyword extraction. Keywords and texts may be str or bytes, but not a mix.
+
+    By default the automaton follows goto/fail links stored in dicts. With dense=True
+    the fail links are resolved ahead of time into a full transition table stored in a
+    flat array, trading memory (states x alphabet size) for one lookup per character.
+    """
+
+    def __init__(self, keywords, dense=False):
+        """
+        Build the automaton.
+
+        Args:
+        - keywords (iterable): The literal keywords (str or bytes) to search for. Duplicates are ignored.
+        - dense (bool): Build an array-backed transition table instead of following fail links.
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        if not self.keywords:
+            raise ValueError('AhoCorasick needs at least one keyword')
+        if not all(self.keywords):
+            raise ValueError('keywords must not be empty')
+        self.dense = dense
+        self.max_length = max(len(keyword) for keyword in self.keywords)
+
+        goto = [{}]
+        outputs = [()]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for symbol in keyword:
+                next_state = goto[state].get(symbol)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][symbol] = next_state
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] = (index,)
+
+        # Breadth-first pass: fail links point to the longest proper suffix that is also
+        # a trie path, and each state inherits the outputs of its fail state.
+        fail = [0] * len(goto)
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for symbol, next_state in goto[state].items():
+                fallback = fail[state]
+                while fallback and symbol not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(symbol, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+                queue.append(next_state)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+        self._lengths = [len(keyword) for keyword in self.keywords]
+        if dense:
+            self._build_table(order)
+
+    def _build_table(self, order):
+        alphabet = sorted({symbol for transitions in self._goto for symbol in transitions})
+        # Column 0 stands for every symbol that does not occur in any keyword.
+        self._columns = {symbol: column for column, symbol in enumerate(alphabet, 1)}
+        width = len(alphabet) + 1
+        # Cells hold the row offset (state * width) of the next state rather than its
+        # number, which saves a multiplication per scanned symbol.
+        table = array('l', [0]) * (width * len(self._goto))
+        for symbol, next_state in self._goto[0].items():
+            table[self._columns[symbol]] = next_state * width
+        for state in order:
+            row = state * width
+            fail_row = self._fail[state] * width
+            table[row:row + width] = table[fail_row:fail_row + width]
+            for symbol, next_state in self._goto[state].items():
+                table[row + self._columns[symbol]] = next_state * width
+        self._table = table
+        self._row_outputs = {state * width: output for state, output in enumerate(self._outputs) if output}
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __repr__(self):
+        return f'AhoCorasick({len(self.keywords)} keywords, {len(self._goto)} states, dense={self.dense})'
+
+    def _iter_overlapping(self, input_text):
+        lengths = self._lengths
+        if self.dense:
+            table, columns, row_outputs = self._table, self._columns, self._row_outputs
+            row = 0
+            for position, symbol in enumerate(input_text, 1):
+                row = table[row + columns.get(symbol, 0)]
+                if row in row_outputs:
+                    for index in row_outputs[row]:
+                        yield position - lengths[index], position, index
+        else:
+            goto, fail, outputs = self._goto, self._fail, self._outputs
+            state = 0
+            for position, symbol in enumerate(input_text, 1):
+                while state and symbol not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(symbol, 0)
+                for index in outputs[state]:
+                    yield position - lengths[index], position, index
+
+    def _iter_leftmost_longest(self, input_text):
+        # Matches arrive ordered by end offset. A pending match can be settled once the
+        # scan is max_length past its start, because no later match can start earlier.
+        max_length = self.max_length
+        pending = []
+        last_end = 0
+        for start, end, index in self._iter_overlapping(input_text):
+            heapq.heappush(pending, (start, -end, index))
+            while pending and pending[0][0] <= end - max_length:
+                start, end_key, index = heapq.heappop(pending)
+                if start >= last_end:
+                    last_end = -end_key
+                    yield start, last_end, index
+        while pending:
+            start, end_key, index = heapq.heappop(pending)
+            if start >= last_end:
+                last_end = -end_key
+                yield start, last_end, index
+
+    def iter_find(self, input_text, overlapping=False):
+        """
+        Lazily iterate over keyword matches in a text.
+
+        Args:
+        - input_text (str or bytes): The text to be searched.
+        - overlapping (bool): Report every occurrence, including overlapping ones, ordered by end offset.
+          By default only non-overlapping matches are reported, preferring the leftmost and then the
+          longest keyword, ordered by start offset.
+
+        Returns:
+        - generator: Yields (start, end, keyword) tuples.
+        """
+        keywords = self.keywords
+        matches = self._iter_overlapping(input_text) if overlapping else self._iter_leftmost_longest(input_text)
+        for start, end, index in matches:
+            yield start, end, keywords[index]
+
+    def find_all(self, input_text, overlapping=False):
+        """
+        Find all keyword occurrences in a text.
+
+        Args:
+        - input_text (str or bytes): The text to be searched.
+        - overlapping (bool): Include overlapping occurrences, see iter_find.
+
+        Returns:
+        - list: List of matched keywords in the order they were found.
+        """
+        return [keyword for _, _, keyword in self.iter_find(input_text, overlapping)]
+
+    def find_all_spans(self, input_text, overlapping=False):
+        """
+        Find the (start, end) offsets of all keyword occurrences in a text.
+
+        Args:
+        - input_text (str or bytes): The text to be searched.
+        - overlapping (bool): Include overlapping occurrences, see iter_find.
+
+        Returns:
+        - list: List of (start, end) tuples.
+        """
+        return [(start, end) for start, end, _ in self.iter_find(input_text, overlapping)]
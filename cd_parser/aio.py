@@ -0,0 +1,169 @@
+import asyncio
+import functools
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from .bulk import _parse, _thread_schema
+from .regex_parser import RegexParser
+
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_lock = threading.Lock()
+_executor = None
+_max_workers = DEFAULT_MAX_WORKERS
+_max_concurrency = None
+# One semaphore per event loop, since asyncio primitives are bound to the loop that uses them.
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def configure(max_workers=DEFAULT_MAX_WORKERS, max_concurrency=None):
+    """
+    Configure the executor shared by all async helpers.
+
+    Parameters:
+    - max_workers (int): Number of threads doing the parsing and scanning.
+    - max_concurrency (int): Maximum number of jobs in flight per event loop; further calls wait
+      without queueing work. Defaults to 4 x max_workers.
+    """
+    global _executor, _max_workers, _max_concurrency
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+        _max_workers = max_workers
+        _max_concurrency = max_concurrency
+        _semaphores.clear()
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix='cd_parser')
+        return _executor
+
+
+async def run(function, *args, **kwargs):
+    """
+    Run a blocking function on the shared executor, respecting the concurrency limit.
+
+    Parameters:
+    - function (callable): The function to run.
+    - *args, **kwargs: Arguments passed to the function.
+
+    Returns:
+    - object: The function's return value.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_max_concurrency or 4 * _max_workers)
+    async with semaphore:
+        return await loop.run_in_executor(_get_executor(), functools.partial(function, *args, **kwargs))
+
+
+class AsyncXpathParser:
+    """
+    Awaitable constructors that build XpathParser trees off the event loop.
+
+    lxml releases the GIL while parsing, so parsing on the executor keeps the loop responsive
+    and runs in parallel with it. Each executor thread uses its own lxml parser and its own
+    compiled copy of each schema.
+    """
+
+    @staticmethod
+    async def parse(document, **kwargs):
+        """
+        Parse a document on the executor.
+
+        Parameters:
+        - document (str or bytes): The raw HTML document. Bytes are decoded by lxml.
+        - **kwargs: Extra XpathParser options such as namespaces, indexed, profile or encoding
+          (for bytes, see XpathParser.from_bytes).
+
+        Returns:
+        - XpathParser: The parsed document, ready for (fast, synchronous) queries.
+        """
+        return await run(_parse, document, **kwargs)
+
+
+def _extract(document, schema, profile, encoding):
+    return _thread_schema(schema).extract(_parse(document, profile=profile, encoding=encoding))
+
+
+async def aextract(document, schema, profile=None, encoding=None):
+    """
+    Parse a document and extract a schema from it on the executor.
+
+    Parameters:
+    - document (str or bytes): The raw HTML document. Bytes are decoded by lxml.
+    - schema (Schema): The extraction schema. Each executor thread evaluates its own compiled copy.
+    - profile (ParserProfile): Optional parser profile, e.g. EXTRACTION_PROFILE. Defaults to lxml's defaults.
+    - encoding (str): Encoding of a bytes document, e.g. from the HTTP Content-Type header. Without it
+      lxml uses the BOM or <meta charset> and falls back to Latin-1.
+
+    Returns:
+    - dict: Mapping of field name -> extracted value.
+    """
+    return await run(_extract, document, schema, profile, encoding)
+
+
+class AsyncRegexParser:
+    """
+    Awaitable versions of the heavy RegexParser scans, run on the shared executor.
+
+    re holds the GIL while matching, so these do not run in parallel with other Python code;
+    they keep the loop responsive because the interpreter switches threads during long scans.
+    """
+
+    @staticmethod
+    async def replace(regex_string, new_text, input_text, flags=0):
+        """
+        Awaitable RegexParser.replace.
+        """
+        return await run(RegexParser.replace, regex_string, new_text, input_text, flags)
+
+    @staticmethod
+    async def replace_many(replacements, input_text, literal=False, flags=0):
+        """
+        Awaitable RegexParser.replace_many.
+        """
+        return await run(RegexParser.replace_many, replacements, input_text, literal, flags)
+
+    @staticmethod
+    async def find_all(regex_string, input_text, flags=0):
+        """
+        Awaitable RegexParser.find_all.
+        """
+        return await run(RegexParser.find_all, regex_string, input_text, flags)
+
+    @staticmethod
+    async def find_all_spans(regex_string, input_text, flags=0, packed=None):
+        """
+        Awaitable RegexParser.find_all_spans.
+        """
+        return await run(RegexParser.find_all_spans, regex_string, input_text, flags, packed)
+
+    @staticmethod
+    async def find_first(regex_string, input_text, flags=0):
+        """
+        Awaitable RegexParser.find_first.
+        """
+        return await run(RegexParser.find_first, regex_string, input_text, flags)
+
+    @staticmethod
+    async def find_keywords(keywords, input_text, overlapping=False, dense=False):
+        """
+        Awaitable RegexParser.find_keywords.
+        """
+        return await run(RegexParser.find_keywords, keywords, input_text, overlapping, dense)
+
+    @staticmethod
+    async def split(regex_string, input_text, flags=0):
+        """
+        Awaitable RegexParser.split.
+        """
+        return await run(RegexParser.split, regex_string, input_text, flags)
@@ -0,0 +1,134 @@
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .profile import DEFAULT_PROFILE
+from .schema import Schema
+from .xpath_parser import XpathParser
+
+
+# Schema, parser profile and encoding of the current worker process, installed once by the
+# pool initializer so they are not pickled again with every chunk of documents.
+_worker_schema = None
+_worker_profile = None
+_worker_encoding = None
+
+
+def _init_worker(schema, profile, encoding):
+    global _worker_schema, _worker_profile, _worker_encoding
+    _worker_schema = schema
+    _worker_profile = profile
+    _worker_encoding = encoding
+
+
+def _parse(document, parser=None, profile=None, encoding=None, **options):
+    # Without an explicit parser, parsing goes through a profile's per-thread parser: lxml
+    # serialises parsing on a shared parser instance, which would defeat the threads.
+    # encoding only applies to bytes; str documents are already decoded.
+    if parser is None and profile is None:
+        profile = DEFAULT_PROFILE
+    if isinstance(document, str):
+        return XpathParser(document, parser=parser, profile=profile, **options)
+    return XpathParser.from_bytes(document, encoding, parser=parser, profile=profile, **options)
+
+
+_thread_state = threading.local()
+
+
+def _thread_schema(schema):
+    # Per-thread compiled copy of a schema: lxml evaluates each compiled XPath object under
+    # its own lock, so threads sharing one Schema would wait on each other.
+    copies = getattr(_thread_state, 'schemas', None)
+    if copies is None:
+        copies = _thread_state.schemas = weakref.WeakKeyDictionary()
+    thread_schema = copies.get(schema)
+    if thread_schema is None:
+        thread_schema = copies[schema] = Schema(schema.fields, schema.namespaces)
+    return thread_schema
+
+
+def _extract_one(document):
+    return _worker_schema.extract(_parse(document, profile=_worker_profile, encoding=_worker_encoding))
+
+
+def bulk_extract(documents, schema, workers=None, chunksize=None, profile=None, encoding=None):
+    """
+    Parse and extract many documents in parallel worker processes.
+
+    lxml trees cannot be pickled, so the raw documents are shipped to the workers, parsed
+    and extracted there, and only the plain result dicts come back.
+
+    Parameters:
+    - documents (iterable): Raw documents as str, or as bytes decoded by lxml.
+    - schema (Schema): The extraction schema. Its Field.post callables must be picklable,
+      and 'raw' fields cannot be used because elements cannot be sent back.
+    - workers (int): Number of worker processes. Defaults to the number of CPUs; 1 runs in
+      the current process without a pool.
+    - chunksize (int): Documents sent to a worker per task. Larger chunks cut IPC overhead
+      for small pages; by default about four chunks per worker are used for sized inputs.
+    - profile (ParserProfile): Optional parser profile, e.g. EXTRACTION_PROFILE. Defaults to lxml's defaults.
+    - encoding (str): Encoding of bytes documents, e.g. from the HTTP Content-Type header. Without it
+      lxml uses the BOM or <meta charset> and falls back to Latin-1, garbling UTF-8 pages that declare neither.
+
+    Returns:
+    - list: One result dict per document, in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [schema.extract(_parse(document, profile=profile, encoding=encoding)) for document in documents]
+
+    if chunksize is None:
+        try:
+            chunksize = max(1, len(documents) // (workers * 4))
+        except TypeError:
+            chunksize = 16
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(schema, profile, encoding)) as executor:
+        return list(executor.map(_extract_one, documents, chunksize=chunksize))
+
+
+def parse_many(documents, workers=None, profile=None, encoding=None):
+    """
+    Parse many documents on a thread pool.
+
+    lxml releases the GIL while parsing, so threads give real parallelism for the parse
+    itself. Each thread parses with its own lxml parser instance.
+
+    Parameters:
+    - documents (iterable): Raw documents as str, or as bytes decoded by lxml.
+    - workers (int): Number of threads. Defaults to the number of CPUs.
+    - profile (ParserProfile): Optional parser profile, e.g. EXTRACTION_PROFILE. Defaults to lxml's defaults.
+    - encoding (str): Encoding of bytes documents, see bulk_extract.
+
+    Returns:
+    - list: One XpathParser per document, in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda document: _parse(document, profile=profile, encoding=encoding), documents))
+
+
+def extract_many(documents, schema, workers=None, profile=None, encoding=None):
+    """
+    Parse and extract many documents on a thread pool.
+
+    Each thread uses its own lxml parser and its own compiled copy of the schema. Unlike
+    bulk_extract nothing is pickled, so 'raw' fields and unpicklable post callables work.
+
+    Parameters:
+    - documents (iterable): Raw documents as str, or as bytes decoded by lxml.
+    - schema (Schema): The extraction schema.
+    - workers (int): Number of threads. Defaults to the number of CPUs.
+    - profile (ParserProfile): Optional parser profile, e.g. EXTRACTION_PROFILE. Defaults to lxml's defaults.
+    - encoding (str): Encoding of bytes documents, see bulk_extract.
+
+    Returns:
+    - list: One result dict per document, in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    def extract(document):
+        return _thread_schema(schema).extract(_parse(document, profile=profile, encoding=encoding))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract, documents))
@@ -0,0 +1,191 @@
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    """
+    A small thread-safe, size-bounded least-recently-used cache.
+
+    Used to keep compiled patterns and expressions around between calls so that
+    hot entries are built once and cold ones are evicted.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+        - maxsize (int): Maximum number of entries to keep. 0 disables caching.
+        """
+        if maxsize < 0:
+            raise ValueError('maxsize must be >= 0')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """
+        Return the cached value for a key, building and storing it on a miss.
+
+        Args:
+        - key (hashable): The cache key.
+        - build (callable): Called with no arguments to create the value on a miss.
+
+        Returns:
+        - object: The cached or newly built value.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+
+        # Build outside the lock so a slow compile does not serialise other lookups.
+        value = build()
+        if self.maxsize == 0:
+            return value
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def resize(self, maxsize):
+        """
+        Change the maximum size, evicting the oldest entries if necessary.
+
+        Args:
+        - maxsize (int): New maximum number of entries. 0 disables caching.
+        """
+        if maxsize < 0:
+            raise ValueError('maxsize must be >= 0')
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Drop all entries and reset the hit/miss/eviction counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """
+        Report cache statistics.
+
+        Returns:
+        - CacheInfo: Named tuple of (hits, misses, evictions, maxsize, currsize).
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+
+class ThreadLocalLRUCache:
+    """
+    One LRUCache per thread, for cached values that should not be shared between threads.
+
+    Each thread builds and keeps its own entries, so no two threads ever use the same
+    cached object. Statistics are summed over the threads that are still alive; a thread's
+    entries and counts are dropped when it exits.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+        - maxsize (int): Maximum number of entries to keep per thread. 0 disables caching.
+        """
+        if maxsize < 0:
+            raise ValueError('maxsize must be >= 0')
+        self.maxsize = maxsize
+        self._local = threading.local()
+        self._caches = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def _thread_cache(self):
+        cache = getattr(self._local, 'cache', None)
+        if cache is None:
+            with self._lock:
+                cache = self._local.cache = LRUCache(self.maxsize)
+                self._caches.add(cache)
+        return cache
+
+    def _live_caches(self):
+        with self._lock:
+            return list(self._caches)
+
+    def get(self, key, build):
+        """
+        Return the calling thread's cached value for a key, building and storing it on a miss.
+
+        Args:
+        - key (hashable): The cache key.
+        - build (callable): Called with no arguments to create the value on a miss.
+
+        Returns:
+        - object: The cached or newly built value.
+        """
+        return self._thread_cache().get(key, build)
+
+    def resize(self, maxsize):
+        """
+        Change the maximum size of every thread's cache, evicting the oldest entries if necessary.
+
+        Args:
+        - maxsize (int): New maximum number of entries per thread. 0 disables caching.
+        """
+        if maxsize < 0:
+            raise ValueError('maxsize must be >= 0')
+        with self._lock:
+            self.maxsize = maxsize
+            caches = list(self._caches)
+        for cache in caches:
+            cache.resize(maxsize)
+
+    def clear(self):
+        """
+        Drop all entries of every thread and reset the counters.
+        """
+        for cache in self._live_caches():
+            cache.clear()
+
+    def info(self):
+        """
+        Report cache statistics summed over the live threads.
+
+        Returns:
+        - CacheInfo: Named tuple of (hits, misses, evictions, maxsize, currsize); maxsize is per thread.
+        """
+        infos = [cache.info() for cache in self._live_caches()]
+        return CacheInfo(
+            sum(info.hits for info in infos),
+            sum(info.misses for info in infos),
+            sum(info.evictions for info in infos),
+            self.maxsize,
+            sum(info.currsize for info in infos),
+        )
+
+    def __len__(self):
+        return sum(len(cache) for cache in self._live_caches())
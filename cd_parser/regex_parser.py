@@ -1,13 +1,529 @@
+import mmap
 import re
+from array import array
+from contextlib import contextmanager
+
+from .aho_corasick import AhoCorasick
+from .cache import LRUCache
+from .regex_set import RegexSet
+
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _like(value, input_text):
+    # Bytes-like inputs (bytes, bytearray, memoryview, mmap) need bytes patterns and
+    # arguments; str arguments are encoded as UTF-8 so callers can keep passing str.
+    if isinstance(value, str) and not isinstance(input_text, str):
+        return value.encode('utf-8')
+    return value
+
+
+def _slice(input_text, start, end):
+    # Slicing a memoryview gives another view and slicing a bytearray another bytearray;
+    # like re's own results, pieces of any bytes-like input are returned as bytes.
+    piece = input_text[start:end]
+    return piece if isinstance(piece, (str, bytes)) else bytes(piece)
+
+
+# The literal helpers below reproduce what the lookaround patterns used by
+# find_before/find_after/find_between match ('.+' is greedy and never crosses a
+# newline) using find/rfind, and return (start, end) spans. They work on str and
+# on any bytes-like input that has find/rfind (bytes, bytearray, mmap).
+
+def _newline(input_text):
+    return '\n' if isinstance(input_text, str) else b'\n'
+
+
+def _line_end(input_text, pos):
+    end = input_text.find(_newline(input_text), pos)
+    return len(input_text) if end == -1 else end
+
+
+def _literal_before_span(search_text, input_text):
+    newline = _newline(input_text)
+    pos = input_text.find(search_text, 1)
+    while pos != -1 and input_text[pos - 1:pos] == newline:
+        pos = input_text.find(search_text, pos + 1)
+    if pos == -1:
+        return None
+    start = input_text.rfind(newline, 0, pos) + 1
+    end = input_text.rfind(search_text, start + 1, _line_end(input_text, pos) + len(search_text))
+    return start, end
+
+
+def _literal_after_span(search_text, input_text):
+    newline = _newline(input_text)
+    pos = input_text.find(search_text)
+    while pos != -1:
+        start = pos + len(search_text)
+        if start < len(input_text) and input_text[start:start + 1] != newline:
+            return start, _line_end(input_text, start)
+        pos = input_text.find(search_text, pos + 1)
+    return None
+
+
+def _literal_between_span(left_side, right_side, input_text):
+    newline = _newline(input_text)
+    pos = input_text.find(left_side)
+    while pos != -1:
+        start = pos + len(left_side)
+        if start < len(input_text) and input_text[start:start + 1] != newline:
+            end = input_text.rfind(right_side, start + 1, _line_end(input_text, start) + len(right_side))
+            if end != -1:
+                return start, end
+        pos = input_text.find(left_side, pos + 1)
+    return None
+
+
+def _regex_span(parts, input_text):
+    parts = [_like(part, input_text) for part in parts]
+    match = RegexParser._compile(parts[0][:0].join(parts)).search(input_text)
+    return match.span() if match else None
+
+
+def _before_span(search_text, input_text, use_regex):
+    search_text = _like(search_text, input_text)
+    if not use_regex:
+        if not isinstance(input_text, memoryview):
+            return _literal_before_span(search_text, input_text)
+        search_text = re.escape(search_text)
+    return _regex_span(('.+(?=', search_text, ')'), input_text)
+
+
+def _after_span(search_text, input_text, use_regex):
+    search_text = _like(search_text, input_text)
+    if not use_regex:
+        if not isinstance(input_text, memoryview):
+            return _literal_after_span(search_text, input_text)
+        search_text = re.escape(search_text)
+    return _regex_span(('(?<=', search_text, ').+'), input_text)
+
+
+def _between_span(left_side, right_side, input_text, use_regex):
+    left_side = _like(left_side, input_text)
+    right_side = _like(right_side, input_text)
+    if not use_regex:
+        if not isinstance(input_text, memoryview):
+            return _literal_between_span(left_side, right_side, input_text)
+        left_side, right_side = re.escape(left_side), re.escape(right_side)
+    return _regex_span(('(?<=', left_side, ').+(?=', right_side, ')'), input_text)
+
+
+def _iter_all(pattern, input_text):
+    # Yields the same items as pattern.findall, one match at a time.
+    empty = '' if isinstance(input_text, str) else b''
+    groups = pattern.groups
+    for match in pattern.finditer(input_text):
+        if groups == 0:
+            yield match.group(0)
+        elif groups == 1:
+            value = match.group(1)
+            yield empty if value is None else value
+        else:
+            yield match.groups(empty)
+
+
+def _iter_split(pattern, input_text):
+    # Yields the same items as pattern.split, one piece at a time.
+    pos = 0
+    for match in pattern.finditer(input_text):
+        yield _slice(input_text, pos, match.start())
+        yield from match.groups()
+        pos = match.end()
+    yield _slice(input_text, pos, len(input_text))
+
+
+def _keyword_regex(keywords):
+    # Compiles literal keywords into a regex shaped like their trie, e.g. cat, category
+    # and car become ca(?:r|t(?:egory)?). Alternatives never share a prefix, so re does
+    # not backtrack across keywords, and greedy optional suffixes make the longest
+    # keyword win. Bytes keywords are built as latin-1 text and encoded back.
+    is_bytes = isinstance(keywords[0], bytes)
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for symbol in keyword.decode('latin-1') if is_bytes else keyword:
+            node = node.setdefault(symbol, {})
+        node[None] = True
+
+    def run(symbol, node):
+        # Follows a chain of single-child, non-final nodes so it becomes one escaped run.
+        symbols = [symbol]
+        while len(node) == 1 and None not in node:
+            (symbol, node), = node.items()
+            symbols.append(symbol)
+        return re.escape(''.join(symbols)), node
+
+    # Post-order walk with an explicit stack, so long keywords cannot hit the recursion limit.
+    edges = {}
+    sources = {}
+    stack = [trie]
+    while stack:
+        node = stack[-1]
+        if id(node) not in edges:
+            edges[id(node)] = [run(symbol, node[symbol]) for symbol in sorted(
+                symbol for symbol in node if symbol is not None)]
+            stack.extend(child for _, child in edges[id(node)])
+            continue
+        stack.pop()
+        branches = [prefix + sources[id(child)] for prefix, child in edges[id(node)]]
+        if not branches:
+            sources[id(node)] = ''
+            continue
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        sources[id(node)] = f'(?:{body})?' if None in node else body
+
+    source = sources[id(trie)]
+    try:
+        return re.compile(source.encode('latin-1') if is_bytes else source)
+    except RecursionError:
+        # Hundreds of keywords that are prefixes of each other nest groups deeper than re's
+        # parser can handle; a plain alternation, longest keyword first, matches the same.
+        escaped = [re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)]
+        return re.compile((b'|' if is_bytes else '|').join(escaped))
+
+
+def _pack_spans(spans, packed):
+    if packed is None:
+        return list(spans)
+    if packed not in ('array', 'numpy'):
+        raise ValueError("packed must be None, 'array' or 'numpy'")
+    buffer = array('q')
+    for span in spans:
+        buffer.extend(span)
+    if packed == 'array':
+        return buffer
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("packed='numpy' requires numpy; install it with 'pip install numpy'") from None
+    return numpy.frombuffer(buffer, dtype=numpy.int64).reshape(-1, 2)
+
+
+def _iter_spans(pattern, input_text):
+    for match in pattern.finditer(input_text):
+        yield match.span()
+
+
+def _scan_stream(compile_pattern, stream, max_match_length, chunk_size):
+    # compile_pattern is called with the first chunk, so the pattern can be encoded to
+    # match the stream's type (str or bytes). Matches starting in the last max_match_length characters of the buffer
+    # could still grow with the next chunk, so they are carried over and
+    # rescanned instead of being yielded early.
+    if max_match_length < 0 or chunk_size <= 0:
+        raise ValueError('max_match_length must be >= 0 and chunk_size > 0')
+    read = stream.read if hasattr(stream, 'read') else stream.recv
+    buffer = None
+    offset = 0
+    while True:
+        chunk = read(chunk_size)
+        at_eof = not chunk
+        if buffer is None:
+            buffer = chunk
+            pattern = compile_pattern(chunk)
+        elif not at_eof:
+            buffer += chunk
+        limit = len(buffer) if at_eof else len(buffer) - max_match_length
+        keep_from = max(limit, 0)
+        for match in pattern.finditer(buffer):
+            start, end = match.span()
+            if start >= limit and not at_eof:
+                break
+            yield offset + start, offset + end, match.group(0)
+            keep_from = max(keep_from, end)
+        if at_eof:
+            return
+        buffer = buffer[keep_from:]
+        offset += keep_from
+
+
+class CompiledRegexParser:
+    """
+    RegexParser operations bound to a single precompiled pattern.
+
+    Create one with RegexParser.compile() and reuse it in hot loops; no pattern
+    lookup or hashing happens per call.
+    """
+
+    def __init__(self, pattern):
+        """
+        Initialize the parser with a compiled pattern.
+
+        Args:
+        - pattern (re.Pattern): The compiled regex pattern.
+        """
+        self.pattern = pattern
+
+    def __repr__(self):
+        return f'CompiledRegexParser({self.pattern.pattern!r}, flags={self.pattern.flags})'
+
+    def replace(self, new_text, input_text):
+        """
+        Replace occurrences of the pattern with a new string.
+
+        Args:
+        - new_text (str): The replacement string.
+        - input_text (str): The text to be searched and replaced.
+
+        Returns:
+        - str: Modified string after replacements.
+        """
+        return self.pattern.sub(new_text, input_text)
+
+    def find_all(self, input_text):
+        """
+        Find all occurrences of the pattern in a string.
+
+        Args:
+        - input_text (str): The text to be searched.
+
+        Returns:
+        - list: List of all matches.
+        """
+        return self.pattern.findall(input_text)
+
+    def find_all_spans(self, input_text, packed=None):
+        """
+        Find the (start, end) offsets of all occurrences of the pattern without copying substrings.
+
+        See RegexParser.find_all_spans for the packed formats.
+
+        Args:
+        - input_text (str): The text to be searched.
+        - packed (str): None for a list of tuples, 'array' or 'numpy' for a packed buffer.
+
+        Returns:
+        - list, array.array or numpy.ndarray: The spans of all matches.
+        """
+        return _pack_spans(_iter_spans(self.pattern, input_text), packed)
+
+    def iter_all(self, input_text):
+        """
+        Lazily iterate over all occurrences of the pattern in a string.
+
+        Args:
+        - input_text (str): The text to be searched.
+
+        Returns:
+        - generator: Yields the same items find_all would return, one at a time.
+        """
+        return _iter_all(self.pattern, input_text)
+
+    def scan_stream(self, stream, max_match_length=4096, chunk_size=1 << 20):
+        """
+        Scan a file-like or socket-like object for the pattern in fixed-size chunks.
+
+        See RegexParser.scan_stream for details.
+
+        Args:
+        - stream (file-like): Object with a read(size) or recv(size) method.
+        - max_match_length (int): Upper bound on the length of a single match.
+        - chunk_size (int): Number of characters or bytes read per call.
+
+        Returns:
+        - generator: Yields (start, end, match) tuples with absolute offsets.
+        """
+        return _scan_stream(lambda chunk: self.pattern, stream, max_match_length, chunk_size)
+
+    def find_first(self, input_text):
+        """
+        Find the first occurrence of the pattern in a string.
+
+        Args:
+        - input_text (str): The text to be searched.
+
+        Returns:
+        - str: The first match, or None if no match is found.
+        """
+        match = self.pattern.search(input_text)
+        return match.group(0) if match else None
+
+    def find_first_span(self, input_text):
+        """
+        Find the (start, end) offsets of the first occurrence of the pattern.
+
+        Args:
+        - input_text (str): The text to be searched.
+
+        Returns:
+        - tuple: The (start, end) span of the first match, or None if no match is found.
+        """
+        match = self.pattern.search(input_text)
+        return match.span() if match else None
+
+    def is_match(self, input_text):
+        """
+        Check if the input text matches the pattern from the start.
+
+        Args:
+        - input_text (str): The text to be checked.
+
+        Returns:
+        - bool: True if the input text matches the pattern, otherwise False.
+        """
+        return self.pattern.match(input_text) is not None
+
+    def split(self, input_text):
+        """
+        Split the input text using the pattern.
+
+        Args:
+        - input_text (str): The text to be split.
+
+        Returns:
+        - list: List of substrings obtained after splitting.
+        """
+        return self.pattern.split(input_text)
+
+    def iter_split(self, input_text):
+        """
+        Lazily split the input text using the pattern.
+
+        Args:
+        - input_text (str): The text to be split.
+
+        Returns:
+        - generator: Yields the same substrings split would return, one at a time.
+        """
+        return _iter_split(self.pattern, input_text)
 
 
 class RegexParser:
     """
     A utility class for commonly used regex operations.
+
+    Patterns are compiled once and kept in a bounded LRU cache shared by all
+    methods, so repeated calls with the same pattern never recompile it.
+
+    Besides str, input_text may be any bytes-like object (bytes, bytearray,
+    memoryview or mmap). The text is then scanned in place with a bytes pattern;
+    str patterns and arguments are encoded as UTF-8 for you, and results are
+    returned as bytes.
     """
 
+    _cache = LRUCache(DEFAULT_CACHE_SIZE)
+
+    @staticmethod
+    def _compile(regex_string, flags=0):
+        """
+        Fetch a compiled pattern from the cache, compiling it on a miss.
+
+        Args:
+        - regex_string (str or re.Pattern): The regex pattern. Compiled patterns are returned as is.
+        - flags (int): Flags passed to re.compile. Must be 0 for compiled patterns, as with re.findall.
+
+        Returns:
+        - re.Pattern: The compiled pattern.
+        """
+        if isinstance(regex_string, re.Pattern):
+            if flags:
+                raise ValueError('cannot process flags argument with a compiled pattern')
+            return regex_string
+        key = (type(regex_string), regex_string, flags)
+        return RegexParser._cache.get(key, lambda: re.compile(regex_string, flags))
+
+    @staticmethod
+    def compile(regex_string, flags=0):
+        """
+        Compile a pattern once and return an object exposing the RegexParser methods bound to it.
+
+        Args:
+        - regex_string (str): The regex pattern.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
+
+        Returns:
+        - CompiledRegexParser: Parser bound to the compiled pattern.
+        """
+        return CompiledRegexParser(RegexParser._compile(regex_string, flags))
+
+    @staticmethod
+    def compile_keywords(keywords, dense=False):
+        """
+        Build (or fetch from the cache) an Aho-Corasick matcher for a set of literal keywords.
+
+        Args:
+        - keywords (iterable): The literal keywords (str or bytes) to search for.
+        - dense (bool): Use an array-backed transition table, see AhoCorasick.
+
+        Returns:
+        - AhoCorasick: The keyword matcher.
+        """
+        keywords = tuple(keywords)
+        key = (AhoCorasick, keywords, dense)
+        return RegexParser._cache.get(key, lambda: AhoCorasick(keywords, dense))
+
+    @staticmethod
+    def find_keywords(keywords, input_text, overlapping=False, dense=False):
+        """
+        Find all occurrences of any of many literal keywords in a single linear scan.
+
+        Use this instead of find_all with a large 'foo|bar|baz|...' alternation. Unlike
+        the regex alternation, the longest keyword wins when several start at the same offset.
+
+        Args:
+        - keywords (iterable): The literal keywords to search for.
+        - input_text (str): The text to be searched.
+        - overlapping (bool): Include overlapping occurrences.
+        - dense (bool): Use an array-backed transition table, see AhoCorasick.
+
+        Returns:
+        - list: List of matched keywords in the order they were found.
+        """
+        keywords = [_like(keyword, input_text) for keyword in keywords]
+        if isinstance(input_text, mmap.mmap):
+            # Iterating an mmap yields 1-byte bytes objects; a memoryview yields ints like bytes does.
+            input_text = memoryview(input_text)
+        return RegexParser.compile_keywords(keywords, dense).find_all(input_text, overlapping)
+
+    @staticmethod
+    @contextmanager
+    def map_file(path):
+        """
+        Memory-map a file read-only so it can be passed to any RegexParser method without reading it into memory.
+
+        Args:
+        - path (str): Path of the file to map.
+
+        Returns:
+        - contextmanager: Yields an mmap object (or b'' for an empty file) and unmaps it on exit.
+        """
+        with open(path, 'rb') as fh:
+            if not fh.seek(0, 2):
+                yield b''
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
     @staticmethod
-    def replace(regex_string, new_text, input_text):
+    def cache_info():
+        """
+        Report statistics for the compiled pattern cache.
+
+        Returns:
+        - CacheInfo: Named tuple of (hits, misses, evictions, maxsize, currsize).
+        """
+        return RegexParser._cache.info()
+
+    @staticmethod
+    def set_cache_size(maxsize):
+        """
+        Resize the compiled pattern cache, evicting the least recently used patterns if needed.
+
+        Args:
+        - maxsize (int): Maximum number of compiled patterns to keep. 0 disables caching.
+        """
+        RegexParser._cache.resize(maxsize)
+
+    @staticmethod
+    def clear_cache():
+        """
+        Drop all compiled patterns and reset the cache counters.
+        """
+        RegexParser._cache.clear()
+
+    @staticmethod
+    def replace(regex_string, new_text, input_text, flags=0):
         """
         Replace occurrences of a regex pattern with a new string.
 
@@ -15,75 +531,201 @@ class RegexParser:
         - regex_string (str): The regex pattern.
         - new_text (str): The replacement string.
         - input_text (str): The text to be searched and replaced.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
 
         Returns:
         - str: Modified string after replacements.
         """
-        return re.sub(regex_string, new_text, input_text)
+        pattern = RegexParser._compile(_like(regex_string, input_text), flags)
+        return pattern.sub(_like(new_text, input_text), input_text)
 
     @staticmethod
-    def find_all(regex_string, input_text):
+    def find_all(regex_string, input_text, flags=0):
         """
         Find all occurrences of a regex pattern in a string.
 
         Args:
         - regex_string (str): The regex pattern.
         - input_text (str): The text to be searched.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
 
         Returns:
         - list: List of all matches.
         """
-        return re.findall(regex_string, input_text)
+        return RegexParser._compile(_like(regex_string, input_text), flags).findall(input_text)
+
+    @staticmethod
+    def find_all_spans(regex_string, input_text, flags=0, packed=None):
+        """
+        Find the (start, end) offsets of all occurrences of a regex pattern without copying substrings.
+
+        Args:
+        - regex_string (str): The regex pattern.
+        - input_text (str): The text to be searched.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
+        - packed (str): None for a list of (start, end) tuples, 'array' for a flat array('q')
+          of start, end pairs, or 'numpy' for an (n, 2) int64 ndarray (requires numpy).
+
+        Returns:
+        - list, array.array or numpy.ndarray: The spans of all matches.
+        """
+        pattern = RegexParser._compile(_like(regex_string, input_text), flags)
+        return _pack_spans(_iter_spans(pattern, input_text), packed)
+
+    @staticmethod
+    def replace_many(replacements, input_text, literal=False, flags=0):
+        """
+        Apply many replacements in a single pass over the text.
+
+        The keys are compiled into one matcher (a RegexSet, or when literal is True a regex
+        shaped like the trie of the keywords) that is cached like any other pattern, and each
+        match is rewritten through a dispatch table, so the text is scanned and rebuilt only once.
+
+        In regex mode the first listed pattern that matches at a position wins; in literal
+        mode the longest keyword wins. Replacements are not rescanned, so one replacement
+        never feeds into another. In regex mode the keys share one set of group numbers, so
+        numbered backreferences (\\1) and conditionals ((?(1)...)) raise ValueError; use named
+        groups with (?P=name) instead.
+
+        Args:
+        - replacements (dict): Mapping of regex pattern (or literal keyword) -> replacement.
+          A str replacement is inserted literally; a callable is called with the matched text.
+        - input_text (str): The text to be searched and replaced.
+        - literal (bool): Treat the keys as literal strings.
+        - flags (int): Optional re flags for regex mode, e.g. re.IGNORECASE.
+
+        Returns:
+        - str: Modified string after replacements.
+        """
+        if not replacements:
+            raise ValueError('replace_many needs at least one replacement')
+        replacements = {
+            _like(key, input_text): value if callable(value) else _like(value, input_text)
+            for key, value in replacements.items()
+        }
+        if not literal:
+            keys = tuple(replacements)
+            regex_set = RegexParser._cache.get((RegexSet, keys, flags), lambda: RegexSet(zip(keys, keys), flags))
+            return regex_set.replace(replacements, input_text)
+
+        keys = tuple(replacements)
+        pattern = RegexParser._cache.get((_keyword_regex, keys), lambda: _keyword_regex(keys))
+        if not any(callable(replacement) for replacement in replacements.values()):
+            return pattern.sub(lambda match: replacements[match.group(0)], input_text)
+
+        def replace_match(match):
+            replacement = replacements[match.group(0)]
+            return replacement(match.group(0)) if callable(replacement) else replacement
+
+        return pattern.sub(replace_match, input_text)
+
+    @staticmethod
+    def iter_all(regex_string, input_text, flags=0):
+        """
+        Lazily iterate over all occurrences of a regex pattern in a string.
+
+        Unlike find_all, matches are produced one at a time with constant memory,
+        so callers can stream them to a sink or stop early.
+
+        Args:
+        - regex_string (str): The regex pattern.
+        - input_text (str): The text to be searched.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
+
+        Returns:
+        - generator: Yields the same items find_all would return, one at a time.
+        """
+        return _iter_all(RegexParser._compile(_like(regex_string, input_text), flags), input_text)
+
+    @staticmethod
+    def scan_stream(regex_string, stream, max_match_length=4096, chunk_size=1 << 20, flags=0):
+        """
+        Scan a file-like or socket-like object for a regex pattern without loading it into memory.
+
+        The stream is read in chunks of chunk_size. The last max_match_length characters
+        (or bytes) of each chunk are carried over to the next one, so matches spanning a
+        chunk boundary are still found, provided no match is longer than max_match_length.
+        Anchors and lookbehinds only see the text kept in the current window.
+
+        Args:
+        - regex_string (str or bytes): The regex pattern. str patterns are encoded as UTF-8 for binary streams.
+        - stream (file-like): Object with a read(size) or recv(size) method.
+        - max_match_length (int): Upper bound on the length of a single match.
+        - chunk_size (int): Number of characters or bytes read per call.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
+
+        Returns:
+        - generator: Yields (start, end, match) tuples, with offsets relative to the start of the stream.
+        """
+        return _scan_stream(
+            lambda chunk: RegexParser._compile(_like(regex_string, chunk), flags), stream, max_match_length, chunk_size)
 
     @staticmethod
-    def find_first(regex_string, input_text):
+    def find_first(regex_string, input_text, flags=0):
         """
         Find the first occurrence of a regex pattern in a string.
 
         Args:
         - regex_string (str): The regex pattern.
         - input_text (str): The text to be searched.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
 
         Returns:
         - str: The first match, or None if no match is found.
         """
-        match = re.search(regex_string, input_text)
+        match = RegexParser._compile(_like(regex_string, input_text), flags).search(input_text)
         return match.group(0) if match else None
 
     @staticmethod
-    def find_before(search_text, input_text):
+    def find_first_span(regex_string, input_text, flags=0):
+        """
+        Find the (start, end) offsets of the first occurrence of a regex pattern.
+
+        Args:
+        - regex_string (str): The regex pattern.
+        - input_text (str): The text to be searched.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
+
+        Returns:
+        - tuple: The (start, end) span of the first match, or None if no match is found.
+        """
+        match = RegexParser._compile(_like(regex_string, input_text), flags).search(input_text)
+        return match.span() if match else None
+
+    @staticmethod
+    def find_before(search_text, input_text, use_regex=False):
         """
         Find the portion of text immediately before a given substring.
 
         Args:
         - search_text (str): The substring to search for.
         - input_text (str): The text to be searched.
+        - use_regex (bool): Treat search_text as a regex pattern instead of a literal string.
 
         Returns:
         - str: Text before the substring, or None if substring is not found.
         """
-        reg_str = f'.+(?={search_text})'
-        match = re.search(reg_str, input_text)
-        return match.group(0) if match else None
+        span = _before_span(search_text, input_text, use_regex)
+        return _slice(input_text, *span) if span else None
 
     @staticmethod
-    def find_after(search_text, input_text):
+    def find_after(search_text, input_text, use_regex=False):
         """
         Find the portion of text immediately after a given substring.
 
         Args:
         - search_text (str): The substring to search for.
         - input_text (str): The text to be searched.
+        - use_regex (bool): Treat search_text as a regex pattern instead of a literal string.
 
         Returns:
         - str: Text after the substring, or None if substring is not found.
         """
-        reg_str = f'(?<={search_text}).+'
-        match = re.search(reg_str, input_text)
-        return match.group(0) if match else None
+        span = _after_span(search_text, input_text, use_regex)
+        return _slice(input_text, *span) if span else None
 
     @staticmethod
-    def find_between(left_side, right_side, input_text):
+    def find_between(left_side, right_side, input_text, use_regex=False):
         """
         Find text between two specified substrings.
 
@@ -91,38 +733,71 @@ class RegexParser:
         - left_side (str): The left boundary substring.
         - right_side (str): The right boundary substring.
         - input_text (str): The text to be searched.
+        - use_regex (bool): Treat the boundaries as regex patterns instead of literal strings.
 
         Returns:
         - str: Text between the boundaries, or None if not found.
         """
-        reg_str = f'(?<={left_side}).+(?={right_side})'
-        match = re.search(reg_str, input_text)
-        return match.group(0) if match else None
+        span = _between_span(left_side, right_side, input_text, use_regex)
+        return _slice(input_text, *span) if span else None
 
     @staticmethod
-    def is_match(regex_string, input_text):
+    def find_between_span(left_side, right_side, input_text, use_regex=False):
+        """
+        Find the (start, end) offsets of the text between two specified substrings.
+
+        Args:
+        - left_side (str): The left boundary substring.
+        - right_side (str): The right boundary substring.
+        - input_text (str): The text to be searched.
+        - use_regex (bool): Treat the boundaries as regex patterns instead of literal strings.
+
+        Returns:
+        - tuple: The (start, end) span of the text between the boundaries, or None if not found.
+        """
+        return _between_span(left_side, right_side, input_text, use_regex)
+
+    @staticmethod
+    def is_match(regex_string, input_text, flags=0):
         """
         Check if the input text matches the given regex pattern from the start.
 
         Args:
         - regex_string (str): The regex pattern.
         - input_text (str): The text to be checked.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
 
         Returns:
         - bool: True if the input text matches the pattern, otherwise False.
         """
-        return bool(re.match(regex_string, input_text))
+        return bool(RegexParser._compile(_like(regex_string, input_text), flags).match(input_text))
 
     @staticmethod
-    def split(regex_string, input_text):
+    def split(regex_string, input_text, flags=0):
         """
         Split the input text using the provided regex pattern.
 
         Args:
         - regex_string (str): The regex pattern to split by.
         - input_text (str): The text to be split.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
 
         Returns:
         - list: List of substrings obtained after splitting.
         """
-        return re.split(regex_string, input_text)
+        return RegexParser._compile(_like(regex_string, input_text), flags).split(input_text)
+
+    @staticmethod
+    def iter_split(regex_string, input_text, flags=0):
+        """
+        Lazily split the input text using the provided regex pattern.
+
+        Args:
+        - regex_string (str): The regex pattern to split by.
+        - input_text (str): The text to be split.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
+
+        Returns:
+        - generator: Yields the same substrings split would return, one at a time.
+        """
+        return _iter_split(RegexParser._compile(_like(regex_string, input_text), flags), input_text)
@@ -0,0 +1,181 @@
+import re
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+
+
+# Leading global inline flags such as (?i) or (?sx).
+_GLOBAL_FLAGS = re.compile(r'\(\?([aiLmsux]+)\)')
+
+
+class RegexSet:
+    """
+    Many named regex patterns combined into a single alternation, so a text is scanned once
+    for all of them.
+
+    Matching follows the rules of a single re alternation: the scan moves left to right,
+    at each position the first listed pattern that matches wins, and matches never
+    overlap. This differs from running find_all once per pattern when matches of
+    different patterns overlap. Named groups must be unique across the set. Numbered
+    backreferences (\\1) and conditionals ((?(1)...)) would point at another pattern's
+    groups once combined, so they are rejected with ValueError; use named groups and
+    (?P=name) or (?(name)...) instead. Leading inline flags such as (?i) only apply to
+    their own pattern.
+
+    The combined scan pays off most when patterns start with literal text; re still tries
+    every alternative at each candidate position, so large sets of patterns starting with
+    broad character classes may be no faster than separate scans.
+    """
+
+    def __init__(self, patterns, flags=0):
+        """
+        Compile the combined pattern.
+
+        Args:
+        - patterns (dict or iterable): Mapping of name -> regex pattern, or an iterable of (name, pattern) pairs.
+          Patterns may be str or bytes, but not a mix of both.
+        - flags (int): Optional re flags applied to every pattern, e.g. re.IGNORECASE.
+        """
+        items = list(patterns.items()) if hasattr(patterns, 'items') else list(patterns)
+        if not items:
+            raise ValueError('RegexSet needs at least one pattern')
+
+        # Each alternative is written as (?:pattern)() and identified by its trailing
+        # empty marker group, which is always the last group to close and therefore
+        # the match's lastindex. Unlike wrapping each pattern in a capturing group,
+        # this keeps re's first-character prefilter working on the combined pattern.
+        self.names = []
+        self._names_by_group = {}
+        parts = []
+        group = 0
+        for name, regex_string in items:
+            sub_pattern = re.compile(regex_string, flags)
+            alternative = _alternative(sub_pattern.pattern, flags)
+            if sub_pattern.groups and _uses_group_numbers(sub_pattern.pattern, alternative, flags):
+                raise ValueError(
+                    f'pattern {name!r} uses a numbered backreference or conditional, which cannot be '
+                    'combined into a RegexSet; use a named group instead')
+            group += sub_pattern.groups + 1
+            self.names.append(name)
+            self._names_by_group[group] = name
+            parts.append(alternative)
+        self.pattern = re.compile(_text_like(parts[0], '|').join(parts), flags)
+
+    def __repr__(self):
+        return f'RegexSet({self.names!r})'
+
+    def iter_all(self, input_text):
+        """
+        Lazily iterate over matches of any pattern in the set.
+
+        Args:
+        - input_text (str): The text to be searched.
+
+        Returns:
+        - generator: Yields (name, match) pairs, where match is the re.Match of the combined pattern.
+        """
+        names_by_group = self._names_by_group
+        for match in self.pattern.finditer(input_text):
+            yield names_by_group[match.lastindex], match
+
+    def find_all(self, input_text):
+        """
+        Find all matches of every pattern in a single pass over the text.
+
+        Args:
+        - input_text (str): The text to be searched.
+
+        Returns:
+        - dict: Mapping of pattern name -> list of matched strings, in text order.
+          Every name is present, with an empty list if it did not match.
+        """
+        results = {name: [] for name in self.names}
+        for name, match in self.iter_all(input_text):
+            results[name].append(match.group(0))
+        return results
+
+    def find_all_spans(self, input_text):
+        """
+        Find the (start, end) offsets of all matches of every pattern in a single pass.
+
+        Args:
+        - input_text (str): The text to be searched.
+
+        Returns:
+        - dict: Mapping of pattern name -> list of (start, end) tuples, in text order.
+        """
+        results = {name: [] for name in self.names}
+        for name, match in self.iter_all(input_text):
+            results[name].append(match.span())
+        return results
+
+    def replace(self, replacements, input_text):
+        """
+        Replace matches of every pattern in a single pass over the text.
+
+        Args:
+        - replacements (dict): Mapping of pattern name -> replacement. A str (or bytes) replacement is
+          inserted literally; a callable is called with the matched text and must return the replacement.
+        - input_text (str): The text to be searched and replaced.
+
+        Returns:
+        - str: Modified string after replacements.
+        """
+        dispatch = {group: replacements[name] for group, name in self._names_by_group.items()}
+        if not any(callable(replacement) for replacement in dispatch.values()):
+            return self.pattern.sub(lambda match: dispatch[match.lastindex], input_text)
+
+        def replace_match(match):
+            replacement = dispatch[match.lastindex]
+            return replacement(match.group(0)) if callable(replacement) else replacement
+
+        return self.pattern.sub(replace_match, input_text)
+
+
+def _alternative(source, flags):
+    # Wraps one pattern as (?:pattern)(). Global inline flags are only allowed at the start
+    # of the combined pattern, so leading ones become a scoped group: (?i)foo -> (?i:foo)().
+    text = source.decode('latin-1') if isinstance(source, bytes) else source
+    inline = ''
+    match = _GLOBAL_FLAGS.match(text)
+    while match:
+        inline += match.group(1)
+        text = text[match.end():]
+        match = _GLOBAL_FLAGS.match(text)
+    # A verbose pattern may end in a comment, which would swallow the closing parenthesis.
+    end = '\n)()' if 'x' in inline or flags & re.VERBOSE else ')()'
+    text = f'(?{"".join(dict.fromkeys(inline))}:{text}{end}'
+    return text.encode('latin-1') if isinstance(source, bytes) else text
+
+
+def _group_references(parsed, references):
+    # Collects the group numbers used by backreferences and (?(group)...) conditionals.
+    if isinstance(parsed, _sre_parse.SubPattern):
+        for op, av in parsed:
+            if op is _sre_parse.GROUPREF:
+                references.append(av)
+            elif op is _sre_parse.GROUPREF_EXISTS:
+                references.append(av[0])
+            _group_references(av, references)
+    elif isinstance(parsed, (list, tuple)):
+        for item in parsed:
+            _group_references(item, references)
+    return references
+
+
+def _uses_group_numbers(source, alternative, flags):
+    # Parsing resolves names to numbers, so numbered and named references are told apart
+    # by parsing the pattern again behind an extra group: references by name shift with
+    # their group, references by number keep pointing at the same (now wrong) group.
+    references = _group_references(_sre_parse.parse(source, flags), [])
+    if not references:
+        return False
+    shifted = _group_references(_sre_parse.parse(_text_like(source, '()') + alternative, flags), [])
+    return any(before == after for before, after in zip(references, shifted))
+
+
+def _text_like(pattern, text):
+    # Returns text as the same type (str or bytes) as pattern.
+    return text.encode('ascii') if isinstance(pattern, bytes) else text
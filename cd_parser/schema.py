@@ -0,0 +1,143 @@
+from lxml import etree
+
+from .regex_parser import RegexParser
+
+
+class Field:
+    """
+    One field of an extraction Schema: an XPath plus the post-processing applied to its results.
+    """
+
+    KINDS = ('text', 'attr', 'html', 'raw')
+
+    def __init__(self, xpath, kind='text', attr=None, regex=None, many=False, default=None, post=None):
+        """
+        Describe a field.
+
+        Parameters:
+        - xpath (str): The XPath expression selecting the field's nodes or values.
+        - kind (str): How to turn each selected node into a value: 'text' (text content),
+          'attr' (the value of attr), 'html' (serialized markup) or 'raw' (the node itself).
+          String, number and boolean XPath results are passed through unchanged.
+        - attr (str): Attribute name, required when kind is 'attr'.
+        - regex (str): Optional regex applied to each value via RegexParser; the first group
+          is kept if the pattern has groups, otherwise the whole match. Non-matching values are dropped.
+        - many (bool): Return a list of all values instead of the first one.
+        - default (object): Value returned when nothing is selected (or [] when many is True).
+        - post (callable): Optional function applied to each value last, e.g. float.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f'kind must be one of {self.KINDS}')
+        if kind == 'attr' and not attr:
+            raise ValueError("kind='attr' needs an attr name")
+        self.xpath = xpath
+        self.kind = kind
+        self.attr = attr
+        self.regex = regex
+        self.many = many
+        self.default = default
+        self.post = post
+
+    def __repr__(self):
+        return f'Field({self.xpath!r}, kind={self.kind!r})'
+
+    def compile(self, namespaces=None):
+        """
+        Compile the XPath and regex of this field.
+
+        Parameters:
+        - namespaces (dict): Optional prefix -> namespace URI mapping.
+
+        Returns:
+        - tuple: (lxml.etree.XPath, CompiledRegexParser or None)
+        """
+        xpath = etree.XPath(self.xpath, namespaces=namespaces, smart_strings=False)
+        regex = RegexParser.compile(self.regex) if self.regex else None
+        return xpath, regex
+
+    def convert(self, node):
+        """
+        Turn one XPath result into a value according to kind.
+
+        Parameters:
+        - node (object): An element or a string/number/boolean XPath result.
+
+        Returns:
+        - object: The converted value.
+        """
+        if not isinstance(node, etree._Element) or self.kind == 'raw':
+            return node
+        if self.kind == 'attr':
+            return node.get(self.attr)
+        if self.kind == 'html':
+            return etree.tostring(node, encoding='unicode', with_tail=False)
+        return ''.join(node.itertext())
+
+
+class Schema:
+    """
+    A declarative set of named fields compiled once and applied to many documents.
+
+    All XPath expressions and regexes are compiled when the schema is created, so extracting
+    a document only evaluates them.
+    """
+
+    def __init__(self, fields, namespaces=None):
+        """
+        Compile the schema.
+
+        Parameters:
+        - fields (dict): Mapping of field name -> Field, or -> XPath string as a shorthand for Field(xpath).
+        - namespaces (dict): Optional prefix -> namespace URI mapping used by all expressions.
+        """
+        self.fields = {name: field if isinstance(field, Field) else Field(field) for name, field in fields.items()}
+        self.namespaces = namespaces
+        self._compiled = [(name, field) + field.compile(namespaces) for name, field in self.fields.items()]
+
+    def __repr__(self):
+        return f'Schema({list(self.fields)!r})'
+
+    def __getstate__(self):
+        # Compiled XPath objects cannot be pickled; they are rebuilt on unpickling, which
+        # lets a schema be shipped to worker processes. Field.post callables must be picklable.
+        return {'fields': self.fields, 'namespaces': self.namespaces}
+
+    def __setstate__(self, state):
+        self.__init__(state['fields'], state['namespaces'])
+
+    def extract(self, parser):
+        """
+        Extract every field from a document.
+
+        Parameters:
+        - parser (XpathParser or lxml element): The parsed document.
+
+        Returns:
+        - dict: Mapping of field name -> extracted value (or list of values for many=True fields).
+        """
+        tree = getattr(parser, 'tree', parser)
+        result = {}
+        for name, field, xpath, regex in self._compiled:
+            nodes = xpath(tree)
+            if not isinstance(nodes, list):
+                nodes = [nodes]
+            values = []
+            for node in nodes:
+                value = field.convert(node)
+                if regex is not None:
+                    if value is None:
+                        continue
+                    match = regex.pattern.search(str(value))
+                    if match is None:
+                        continue
+                    value = match.group(1) if regex.pattern.groups else match.group(0)
+                if field.post is not None:
+                    value = field.post(value)
+                values.append(value)
+                if not field.many:
+                    break
+            if field.many:
+                result[name] = values
+            else:
+                result[name] = values[0] if values else field.default
+        return result
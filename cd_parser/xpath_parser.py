@@ -1,15 +1,359 @@
-from lxml import html
+import copy
+import re
+import sys
+
+from lxml import etree, html
+
+from .cache import ThreadLocalLRUCache
+from .regex_parser import RegexParser
+
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Tag names that the tag index can answer; anything else is evaluated as XPath.
+_PLAIN_TAG = re.compile(r'[A-Za-z_][\w.-]*\Z')
+
+
+def _string_loader(parser, profile, encoding=None):
+    # Returns a function parsing a document string with either the parser or the profile.
+    if profile is None:
+        return lambda data: html.fromstring(data, parser=parser)
+    if parser is not None:
+        raise ValueError('pass either a parser or a profile, not both')
+    return lambda data: profile.fromstring(data, encoding)
 
 
 class XpathParser:
-    def __init__(self, doc_text):
+    # Compiled lxml.etree.XPath objects shared by all parser instances of a thread. lxml
+    # evaluates each XPath object under its own lock, so one process-wide object per
+    # expression would make threads querying with the same expression wait on each other.
+    _cache = ThreadLocalLRUCache(DEFAULT_CACHE_SIZE)
+
+    def __init__(self, doc_text, namespaces=None, indexed=False, lazy=False, parser=None, profile=None):
         """
         Initialize the scraper with a provided HTML or XML document text.
 
         Parameters:
         - doc_text (str): The raw HTML or XML document string to be parsed.
+        - namespaces (dict): Optional prefix -> namespace URI mapping used by all XPath queries.
+        - indexed (bool): Answer select_by_tag and select_by_class from tag and class indexes,
+          built in a single pass over the tree on first use. Worth it when a page is queried repeatedly.
+        - lazy (bool): Only store doc_text and build the tree on the first query. Use source_contains
+          or source_matches to reject irrelevant documents before paying for parsing. doc_text is
+          released once the tree is built.
+        - parser (lxml.html.HTMLParser): Optional parser instance to build the tree with. lxml
+          serialises parsing on a shared parser, so threads should each use their own.
+        - profile (ParserProfile): Optional parser profile, e.g. EXTRACTION_PROFILE; its parser is created
+          once per thread and reused. Cannot be combined with parser.
+        """
+        load = _string_loader(parser, profile)
+        if lazy:
+            self._init_state(None, namespaces, indexed, doc_text, lambda: load(doc_text))
+        else:
+            self._init_state(load(doc_text), namespaces, indexed)
+
+    def _init_state(self, tree, namespaces, indexed, source=None, loader=None):
+        self._tree = tree
+        self._source = source
+        self._loader = loader
+        self.namespaces = namespaces
+        self.indexed = indexed
+        self._id_index = None
+        self._tag_index = None
+        self._class_index = None
+
+    @property
+    def tree(self):
+        """
+        The root lxml element, parsed on first access for lazy parsers.
+        """
+        if self._tree is None and self._loader is not None:
+            self._tree = self._loader()
+            # The tree replaces the raw document, so a parsed page is not held in memory twice.
+            self._loader = None
+            self._source = None
+        return self._tree
+
+    @tree.setter
+    def tree(self, value):
+        self._tree = value
+        self._loader = None
+        self._source = None
+        self.clear_indexes()
+
+    @property
+    def is_parsed(self):
+        """
+        Whether the document tree has been built yet.
+        """
+        return self._tree is not None
+
+    def source_contains(self, text):
+        """
+        Check whether the raw document of a lazy parser contains a literal string, without parsing it.
+        Only available until the tree is built.
+
+        Parameters:
+        - text (str): The literal string to look for.
+
+        Returns:
+        - bool: True if the raw document contains the string.
+        """
+        source = self._lazy_source()
+        if isinstance(text, str) and not isinstance(source, str):
+            text = text.encode('utf-8')
+        return text in source
+
+    def source_matches(self, regex_string, flags=0):
+        """
+        Check whether the raw document of a lazy parser matches a regex pattern, without parsing it.
+        Only available until the tree is built.
+
+        Parameters:
+        - regex_string (str): The regex pattern, searched anywhere in the document via RegexParser.
+        - flags (int): Optional re flags, e.g. re.IGNORECASE.
+
+        Returns:
+        - bool: True if the pattern is found in the raw document.
+        """
+        return RegexParser.find_first_span(regex_string, self._lazy_source(), flags) is not None
+
+    def _lazy_source(self):
+        if self._source is None:
+            raise ValueError('source checks need a lazy parser whose tree has not been built yet')
+        return self._source
+
+    @classmethod
+    def from_element(cls, element, namespaces=None, indexed=False):
+        """
+        Wrap an already parsed lxml element without parsing anything.
+
+        Parameters:
+        - element (lxml.etree._Element): The element to query. Absolute ('//') paths still search its whole document.
+        - namespaces (dict): Optional prefix -> namespace URI mapping used by all XPath queries.
+        - indexed (bool): See XpathParser.__init__.
+
+        Returns:
+        - XpathParser: A parser over the element.
+        """
+        parser = cls.__new__(cls)
+        parser._init_state(element, namespaces, indexed)
+        return parser
+
+    @classmethod
+    def from_bytes(cls, data, encoding=None, namespaces=None, indexed=False, lazy=False, parser=None,
+                   profile=None):
+        """
+        Parse raw, undecoded document bytes.
+
+        The bytes go straight to lxml's C parser, which detects the encoding from the BOM or
+        <meta charset> declaration, saving a decode in Python and a re-encode in lxml. The root
+        is chosen like XpathParser.__init__ (lxml.html.fromstring) does: the <html> element for a
+        full document, the element itself for a single-element fragment, and a wrapping
+        <div> or <span> for other fragments.
+
+        Parameters:
+        - data (bytes): The raw HTML document.
+        - encoding (str): Optional encoding that overrides detection.
+        - namespaces (dict): Optional prefix -> namespace URI mapping used by all XPath queries.
+        - indexed (bool): See XpathParser.__init__.
+        - lazy (bool): See XpathParser.__init__.
+        - parser (lxml.html.HTMLParser): See XpathParser.__init__. Takes precedence over encoding.
+        - profile (ParserProfile): See XpathParser.__init__.
+
+        Returns:
+        - XpathParser: A parser over the document.
+        """
+        if parser is None and profile is None and encoding:
+            parser = html.HTMLParser(encoding=encoding)
+        load = _string_loader(parser, profile, encoding)
+        if not lazy:
+            return cls.from_element(load(data), namespaces, indexed)
+        instance = cls.__new__(cls)
+        instance._init_state(None, namespaces, indexed, data, lambda: load(data))
+        return instance
+
+    @classmethod
+    def from_file(cls, file, encoding=None, namespaces=None, indexed=False, profile=None):
+        """
+        Parse a document from a binary file object, letting lxml decode it.
+
+        The file is read into memory and parsed with from_bytes, so the root is chosen the
+        same way for files, bytes and strings (see from_bytes).
+
+        Parameters:
+        - file (file-like): A file object opened in binary mode.
+        - encoding (str): Optional encoding that overrides detection.
+        - namespaces (dict): Optional prefix -> namespace URI mapping used by all XPath queries.
+        - indexed (bool): See XpathParser.__init__.
+        - profile (ParserProfile): See XpathParser.__init__.
+
+        Returns:
+        - XpathParser: A parser over the document.
         """
-        self.tree = html.fromstring(doc_text)
+        return cls.from_bytes(file.read(), encoding, namespaces, indexed, profile=profile)
+
+    @classmethod
+    def from_path(cls, path, encoding=None, namespaces=None, indexed=False, profile=None):
+        """
+        Parse a document from a file path. The root is chosen as in from_bytes.
+
+        Parameters:
+        - path (str or os.PathLike): Path of the HTML file.
+        - encoding (str): Optional encoding that overrides detection.
+        - namespaces (dict): Optional prefix -> namespace URI mapping used by all XPath queries.
+        - indexed (bool): See XpathParser.__init__.
+        - profile (ParserProfile): See XpathParser.__init__.
+
+        Returns:
+        - XpathParser: A parser over the document.
+        """
+        with open(path, 'rb') as file:
+            return cls.from_file(file, encoding, namespaces, indexed, profile)
+
+    @classmethod
+    def iter_records(cls, source, record_tag, namespaces=None, huge_tree=False):
+        """
+        Stream a large XML document one record at a time with constant memory.
+
+        The document is read with lxml.etree.iterparse. Each completed record_tag element is
+        copied into its own small document, so '//' queries only see that record, and the
+        original is then cleared from the partially built tree along with everything before it.
+
+        Feeds are treated as untrusted: entities are not resolved (so an external entity cannot
+        pull a local file into a record, and entity references are left unexpanded) and nothing
+        is fetched over the network.
+
+        Parameters:
+        - source (str or file-like): Path or binary file object of the XML document.
+        - record_tag (str): Tag of the repeating record elements, e.g. 'product' or '{namespace}product'.
+        - namespaces (dict): Optional prefix -> namespace URI mapping used by all XPath queries.
+        - huge_tree (bool): Lift libxml2's limits on tree depth and text node size. Only enable it
+          for trusted feeds that need it, since the limits protect against hostile documents.
+
+        Returns:
+        - generator: Yields one XpathParser per record.
+        """
+        records = etree.iterparse(
+            source, events=('end',), tag=record_tag,
+            resolve_entities=False, no_network=True, huge_tree=huge_tree,
+        )
+        for _, element in records:
+            yield cls.from_element(copy.deepcopy(element), namespaces)
+            element.clear(keep_tail=False)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    @staticmethod
+    def compile(x_path, namespaces=None, smart_strings=True):
+        """
+        Fetch a compiled XPath expression from the calling thread's cache, compiling it on a miss.
+
+        Parameters:
+        - x_path (str): The XPath expression.
+        - namespaces (dict): Optional prefix -> namespace URI mapping.
+        - smart_strings (bool): Return string results as lxml "smart" strings that point back to
+          their parent element. False returns plain str objects, which are cheaper to create.
+
+        Returns:
+        - lxml.etree.XPath: The compiled expression; call it with an element to evaluate it.
+        """
+        key = (x_path, tuple(sorted(namespaces.items())) if namespaces else None, smart_strings)
+        return XpathParser._cache.get(
+            key, lambda: etree.XPath(x_path, namespaces=namespaces, smart_strings=smart_strings))
+
+    @staticmethod
+    def cache_info():
+        """
+        Report statistics for the compiled XPath cache, summed over the threads that are still alive.
+
+        Returns:
+        - CacheInfo: Named tuple of (hits, misses, evictions, maxsize, currsize); maxsize is per thread.
+        """
+        return XpathParser._cache.info()
+
+    @staticmethod
+    def set_cache_size(maxsize):
+        """
+        Resize the compiled XPath cache of every thread, evicting the least recently used expressions if needed.
+
+        Parameters:
+        - maxsize (int): Maximum number of compiled expressions to keep per thread. 0 disables caching.
+        """
+        XpathParser._cache.resize(maxsize)
+
+    @staticmethod
+    def clear_cache():
+        """
+        Drop the compiled XPath expressions of every thread and reset the cache counters.
+        """
+        XpathParser._cache.clear()
+
+    def build_indexes(self):
+        """
+        Build the tag, class token and id indexes in a single pass over the document.
+
+        Called automatically on first use when the parser was created with indexed=True.
+        """
+        self._build_indexes(ids_only=False)
+
+    def _build_indexes(self, ids_only):
+        # One pass builds the id index, plus the tag and class indexes unless ids_only is set.
+        tags, classes, ids = {}, {}, {}
+        for element in self._document_elements():
+            value = element.get('id')
+            if value is not None:
+                ids.setdefault(value, []).append(element)
+            if ids_only:
+                continue
+            tags.setdefault(element.tag, []).append(element)
+            value = element.get('class')
+            if value:
+                for token in dict.fromkeys(value.split()):
+                    classes.setdefault(token, []).append(element)
+        self._id_index = ids
+        if not ids_only:
+            self._tag_index, self._class_index = tags, classes
+
+    def index_memory(self):
+        """
+        Estimate the memory held by the lookup indexes built so far.
+
+        Counts the index dictionaries, their keys and lists, and the element proxies kept
+        alive by the lists. The lxml tree itself is not included.
+
+        Returns:
+        - int: Approximate size in bytes.
+        """
+        total = 0
+        elements = {}
+        for index in (self._tag_index, self._class_index, self._id_index):
+            if index is None:
+                continue
+            total += sys.getsizeof(index)
+            for key, nodes in index.items():
+                total += sys.getsizeof(key) + sys.getsizeof(nodes)
+                for element in nodes:
+                    elements[id(element)] = element
+        return total + sum(sys.getsizeof(element) for element in elements.values())
+
+    def clear_indexes(self):
+        """
+        Drop the lookup indexes built from the tree. Call this after modifying the tree.
+        """
+        self._id_index = None
+        self._tag_index = None
+        self._class_index = None
+
+    def _document_elements(self, tag=etree.Element):
+        # Every element of the document (or every <tag>), in document order: the nodes
+        # '//*' (or '//tag') selects.
+        return self.tree.getroottree().getroot().iter(tag)
+
+    def _xpath(self, x_path, **variables):
+        # Values are passed as XPath variables ($value) rather than interpolated, so each
+        # select_* method compiles one expression per tag/attribute whatever the values.
+        return XpathParser.compile(x_path, self.namespaces)(self.tree, **variables)
 
     def get_elements(self, x_path):
         """
@@ -21,7 +365,7 @@ class XpathParser:
         Returns:
         - list: List of nodes matching the provided XPath query.
         """
-        return self.tree.xpath(x_path)
+        return self._xpath(x_path)
 
     def get_element(self, x_path):
         """
@@ -33,9 +377,56 @@ class XpathParser:
         Returns:
         - lxml.html.HtmlElement or None: The first node matching the provided XPath query or None if no match is found.
         """
-        elements = self.tree.xpath(x_path)
+        # Stop at the first match instead of building the full result list: a bare //tag
+        # walks the tree with iter(), anything else is evaluated as (x_path)[1].
+        if x_path.startswith('//') and _PLAIN_TAG.match(x_path, 2):
+            return next(self._document_elements(x_path[2:]), None)
+        elements = self._xpath(f'({x_path})[1]')
+        if not isinstance(elements, list):
+            # Not a node-set (e.g. string() or count()): keep the plain evaluation's result.
+            elements = self._xpath(x_path)
         return elements[0] if elements else None
 
+    def get_texts(self, x_path):
+        """
+        Fetches the text of the elements matching an XPath query as plain strings, without
+        creating element objects.
+
+        Parameters:
+        - x_path (str): The XPath query selecting elements.
+
+        Returns:
+        - list: The direct text nodes (text()) of the matched elements, in document order. An element
+          contributes one string per text node, and none if it has no text.
+        """
+        return XpathParser.compile(f'({x_path})/text()', self.namespaces, smart_strings=False)(self.tree)
+
+    def get_attrs(self, x_path, attribute):
+        """
+        Fetches an attribute of the elements matching an XPath query as plain strings, without
+        creating element objects.
+
+        Parameters:
+        - x_path (str): The XPath query selecting elements.
+        - attribute (str): The attribute name.
+
+        Returns:
+        - list: The attribute values, in document order. Elements without the attribute are skipped.
+        """
+        return XpathParser.compile(f'({x_path})/@{attribute}', self.namespaces, smart_strings=False)(self.tree)
+
+    def get_text(self, x_path):
+        """
+        Fetches the text content of the first element matching an XPath query as a plain string.
+
+        Parameters:
+        - x_path (str): The XPath query selecting elements.
+
+        Returns:
+        - str: The string value (all descendant text) of the first match, or '' if nothing matches.
+        """
+        return XpathParser.compile(f'string(({x_path})[1])', self.namespaces, smart_strings=False)(self.tree)
+
     def select_all_nodes(self):
         """
         Select and return all nodes in the document.
@@ -43,7 +434,7 @@ class XpathParser:
         Returns:
         - list: List of all nodes in the document.
         """
-        return self.tree.xpath('.//*')
+        return self._xpath('.//*')
 
     def select_by_tag(self, tag_name):
         """
@@ -55,7 +446,11 @@ class XpathParser:
         Returns:
         - list: List of nodes matching the given tag name.
         """
-        return self.tree.xpath(f'//{tag_name}')
+        if self.indexed and _PLAIN_TAG.match(tag_name):
+            if self._tag_index is None:
+                self.build_indexes()
+            return list(self._tag_index.get(tag_name, ()))
+        return self._xpath(f'//{tag_name}')
 
     def select_by_attribute(self, tag_name, attribute, value):
         """
@@ -69,7 +464,7 @@ class XpathParser:
         Returns:
         - list: List of nodes matching the given criteria.
         """
-        return self.tree.xpath(f'//{tag_name}[@{attribute}="{value}"]')
+        return self._xpath(f'//{tag_name}[@{attribute}=$value]', value=value)
 
     def select_partial_attribute(self, tag_name, attribute, value_substring):
         """
@@ -83,7 +478,7 @@ class XpathParser:
         Returns:
         - list: List of nodes matching the given criteria.
         """
-        return self.tree.xpath(f'//{tag_name}[contains(@{attribute}, "{value_substring}")]')
+        return self._xpath(f'//{tag_name}[contains(@{attribute}, $value)]', value=value_substring)
 
     def select_by_text(self, tag_name, exact_text):
         """
@@ -96,7 +491,7 @@ class XpathParser:
         Returns:
         - list: List of nodes matching the given criteria.
         """
-        return self.tree.xpath(f'//{tag_name}[text()="{exact_text}"]')
+        return self._xpath(f'//{tag_name}[text()=$value]', value=exact_text)
 
     def select_partial_text(self, tag_name, partial_text):
         """
@@ -109,7 +504,7 @@ class XpathParser:
         Returns:
         - list: List of nodes matching the given criteria.
         """
-        return self.tree.xpath(f'//{tag_name}[contains(text(), "{partial_text}")]')
+        return self._xpath(f'//{tag_name}[contains(text(), $value)]', value=partial_text)
 
     def select_nth_child(self, parent_tag, child_tag, n):
         """
@@ -118,12 +513,13 @@ class XpathParser:
         Parameters:
         - parent_tag (str): Name of the parent tag.
         - child_tag (str): Name of the child tag.
-        - n (int): Index (1-based) of the child to select.
+        - n (int): Index (1-based) of the child to select. Strings such as '2' are converted with int().
 
         Returns:
         - list: List of nodes matching the given criteria.
         """
-        return self.tree.xpath(f'//{parent_tag}/{child_tag}[{n}]')
+        # A string variable would be a (always true) boolean predicate rather than a position.
+        return self._xpath(f'//{parent_tag}/{child_tag}[$n]', n=int(n))
 
     def select_by_class(self, tag_name, class_name):
         """
@@ -136,16 +532,77 @@ class XpathParser:
         Returns:
         - list: List of nodes matching the given criteria.
         """
-        return self.tree.xpath(f'//{tag_name}[@class="{class_name}"]')
+        tokens = class_name.split()
+        if self.indexed and tokens and (tag_name == '*' or _PLAIN_TAG.match(tag_name)):
+            if self._class_index is None:
+                self.build_indexes()
+            # The index is keyed by class token; keep the exact @class match of the XPath version.
+            return [
+                element for element in self._class_index.get(tokens[0], ())
+                if element.get('class') == class_name and (tag_name == '*' or element.tag == tag_name)
+            ]
+        return self._xpath(f'//{tag_name}[@class=$value]', value=class_name)
 
     def select_by_id(self, element_id):
         """
         Select a node by its unique ID.
 
+        The first call builds an id -> nodes index in one pass over the document (all indexes at
+        once when the parser was created with indexed=True); later calls are dictionary lookups.
+
         Parameters:
         - element_id (str): The 'id' attribute value of the node.
 
         Returns:
         - list: List of nodes (usually a single node) with the specified ID.
         """
-        return self.tree.xpath(f'//*[@id="{element_id}"]')
+        if self._id_index is None:
+            self._build_indexes(ids_only=not self.indexed)
+        return list(self._id_index.get(element_id, ()))
+
+
+class XpathFeedParser:
+    """
+    Build an XpathParser incrementally from chunks of HTML as they arrive.
+
+    Parsing happens inside feed(), overlapping with network I/O, and elements with one of
+    the watched tags are handed back as soon as their closing tag has been parsed, so
+    metadata such as <head> can be extracted before the body has finished arriving.
+    """
+
+    def __init__(self, watch_tags=('head',), namespaces=None, indexed=False):
+        """
+        Initialize an empty incremental parser.
+
+        Parameters:
+        - watch_tags (tuple): Tags whose elements are returned by feed() once complete.
+        - namespaces (dict): Optional prefix -> namespace URI mapping used by all XPath queries.
+        - indexed (bool): See XpathParser.__init__; applies to the parser returned by close().
+        """
+        self._parser = etree.HTMLPullParser(events=('end',), tag=watch_tags)
+        self._parser.set_element_class_lookup(html.HtmlElementClassLookup())
+        self.namespaces = namespaces
+        self.indexed = indexed
+
+    def feed(self, data):
+        """
+        Parse the next chunk of the document.
+
+        Parameters:
+        - data (bytes or str): The next chunk. Do not mix bytes and str chunks.
+
+        Returns:
+        - list: An XpathParser for each watched element completed by this chunk. Use relative
+          ('.//') paths to stay inside the element; '//' searches everything parsed so far.
+        """
+        self._parser.feed(data)
+        return [XpathParser.from_element(element, self.namespaces) for _, element in self._parser.read_events()]
+
+    def close(self):
+        """
+        Finish parsing once the last chunk has been fed.
+
+        Returns:
+        - XpathParser: A parser over the complete document.
+        """
+        return XpathParser.from_element(self._parser.close(), self.namespaces, self.indexed)
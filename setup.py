@@ -15,6 +15,9 @@ setup(
     install_requires=[
         'lxml==4.9.3',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     classifiers=[
         # For a list of valid classifiers, see https://pypi.org/classifiers/
         'Development Status :: 4 - Beta',